@@ -1,41 +1,300 @@
 from __future__ import annotations
-from typing import List, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import multiprocessing
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import yfinance as yf
+from numba import njit
+import numpy as np
 import pandas as pd
+from pyrate_limiter import Duration, Limiter, RequestRate
+import requests
+from requests import Session
+from requests_cache import CacheMixin, SQLiteCache
+from requests_ratelimiter import LimiterMixin, MemoryQueueBucket
+from yfinance.exceptions import YFRateLimitError
 
-def calculate_annualized_return(option_data: pd.DataFrame, stock_price: float, days_to_expiration: int, type: str) -> pd.DataFrame:
+# Number of option chains fetched concurrently per ticker
+MAX_WORKERS: int = 8
+
+# Yahoo batch quote endpoint, which accepts up to ~50 comma separated symbols per request
+QUOTE_URL: str = "https://query2.finance.yahoo.com/v7/finance/quote"
+QUOTE_BATCH_SIZE: int = 50
+
+class CachedLimiterSession(CacheMixin, LimiterMixin, Session):
+    """
+    requests Session that caches responses and throttles outgoing requests.
+    """
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> CachedLimiterSession:
+    """
+    Return the process-wide session, building it on first use.
+
+    The session is shared by every yf.Ticker so all fetching threads draw from the same
+    rate limit (Yahoo answers 429 above it). Responses are kept on disk for an hour so
+    re-runs skip the network entirely. It is built lazily so processes that never fetch,
+    such as the output workers, never open the cache file.
+
+    :return: Cached, rate-limited session.
+    """
+    return CachedLimiterSession(
+        limiter=Limiter(RequestRate(60, Duration.MINUTE)),
+        bucket_class=MemoryQueueBucket,
+        backend=SQLiteCache("yfinance.cache"),
+        expire_after=3600,
+        allowable_methods=('GET', 'POST'),
+    )
+
+# Yahoo rejects requests without a browser-like user agent
+HEADERS: Dict[str, str] = {"User-Agent": "Mozilla/5.0"}
+
+# Transient failures worth retrying: Yahoo's 429s and dropped or slow connections
+RETRYABLE_ERRORS = (requests.ConnectionError, requests.Timeout, YFRateLimitError)
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Tell whether a failed Yahoo request is worth retrying.
+
+    HTTP errors are only retried for rate limiting (429) and server errors (5xx); other
+    4xx responses such as an invalid crumb or an unknown symbol fail the same way again.
+
+    :param exc: Exception raised by the request.
+    :return: True if the request should be retried.
+    """
+    if isinstance(exc, requests.HTTPError):
+        status = exc.response.status_code if exc.response is not None else None
+        return status is not None and (status == 429 or status >= 500)
+    return isinstance(exc, RETRYABLE_ERRORS)
+
+def with_backoff(fn: Callable[..., Any], *args: Any, retries: int = 5, base: float = 0.5) -> Any:
+    """
+    Call fn, retrying transient Yahoo failures with exponential backoff and jitter.
+
+    :param fn: Callable performing the request.
+    :param args: Positional arguments passed to fn.
+    :param retries: Number of retries before the last error is raised.
+    :param base: Delay in seconds before the first retry, doubled on each further retry.
+    :return: Whatever fn returns.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args)
+        except Exception as exc:
+            if attempt == retries or not is_retryable(exc):
+                raise
+            time.sleep(base * 2 ** attempt + random.random() * 0.1)
+
+@functools.lru_cache(maxsize=None)
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Return the process-wide yf.Ticker for a symbol, constructing it only on first use.
+
+    Repeated lookups of the same symbol reuse its Ticker instead of rebuilding it.
+
+    :param symbol: Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+    :return: Ticker bound to the shared cached session.
+    """
+    return yf.Ticker(symbol, session=get_session())
+
+# Option chain fetches currently on the wire, keyed by (ticker, expiration date)
+_inflight: Dict[Tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+def get_option_chain(ticker_symbol: str, date: str) -> Any:
+    """
+    Fetch the option chain for one expiration, sharing the request with concurrent callers.
+
+    Callers asking for a chain that is already being fetched wait for that
+    request instead of issuing a duplicate one to Yahoo.
+
+    :param ticker_symbol: Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+    :param date: Expiration date as listed in the ticker's options.
+    :return: Option chain with calls and puts frames.
+    """
+    key = (ticker_symbol, date)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[key] = future
+    if not owner:
+        return future.result()
+
+    try:
+        result = with_backoff(get_ticker(ticker_symbol).option_chain, date)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    return result
+
+def _get_crumb() -> str:
+    """
+    Request a crumb matching the session cookie set by the preceding fc.yahoo.com visit.
+
+    :return: Crumb to send along with the session cookie.
     """
-    Calculate the annualized return for each option.
+    response = get_session().get("https://query1.finance.yahoo.com/v1/test/getcrumb", headers=HEADERS)
+    response.raise_for_status()
+    return response.text
+
+def get_credentials() -> str:
+    """
+    Perform Yahoo's cookie + crumb handshake required by the quote endpoint.
+
+    :return: Crumb to send along with the session cookie.
+    """
+    # Served fresh so the cookie lands in the session jar and the crumb matches it
+    session = get_session()
+    with session.cache_disabled():
+        session.get("https://fc.yahoo.com", headers=HEADERS)
+        # The getcrumb endpoint is throttled frequently
+        return with_backoff(_get_crumb)
+
+def _get_quotes(symbols: List[str], crumb: str) -> requests.Response:
+    """
+    Request one batch of quotes from Yahoo's quote endpoint.
+
+    :param symbols: Stock ticker symbols, at most QUOTE_BATCH_SIZE of them.
+    :param crumb: Crumb returned by get_credentials.
+    :return: Successful response from the quote endpoint.
+    """
+    response = get_session().get(QUOTE_URL, params={"symbols": ",".join(symbols), "crumb": crumb}, headers=HEADERS)
+    response.raise_for_status()
+    return response
+
+def fetch_current_prices(tickers: List[str]) -> Dict[str, float]:
+    """
+    Fetch the current price of every ticker using batched quote requests.
+
+    :param tickers: Stock ticker symbols (e.g., ['AAPL', 'TSLA']).
+    :return: Mapping of ticker symbol to its regular market price; symbols Yahoo returned no price for are left out.
+    """
+    crumb = get_credentials()
+    prices: Dict[str, float] = {}
+    for start in range(0, len(tickers), QUOTE_BATCH_SIZE):
+        chunk = tickers[start:start + QUOTE_BATCH_SIZE]
+        response = with_backoff(_get_quotes, chunk, crumb)
+        for quote in response.json()["quoteResponse"]["result"]:
+            price = quote.get("regularMarketPrice")
+            if price is not None:
+                prices[quote["symbol"]] = price
+    return prices
+
+# fastmath without the 'nnan'/'ninf' flags, so the non-finite checks in the kernels are kept
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+@njit(fastmath=FASTMATH, cache=True)
+def _kernel_puts(bid: np.ndarray, strike: np.ndarray, days: int, stock_price: float) -> Tuple[np.ndarray, np.ndarray]:
+    n = bid.shape[0]
+    ar = np.empty(n)
+    dist = np.empty(n)
+    for i in range(n):
+        # For cash secured puts, capital reserved = (strike price - premium) * 100 * Quantity
+        # Return = premium collected / capital reserved
+        capital = strike[i] - bid[i]
+        r = bid[i] / capital * 36500.0 / days if capital != 0.0 and days != 0 else 0.0
+        # Replace infinite or NaN values (e.g., for options with zero intrinsic value)
+        ar[i] = r if np.isfinite(r) else 0.0
+        dist[i] = (stock_price - bid[i] - strike[i]) / stock_price
+    return ar, dist
+
+@njit(fastmath=FASTMATH, cache=True)
+def _kernel_calls(bid: np.ndarray, strike: np.ndarray, days: int, stock_price: float) -> Tuple[np.ndarray, np.ndarray]:
+    n = bid.shape[0]
+    ar = np.empty(n)
+    dist = np.empty(n)
+    for i in range(n):
+        # For covered calls, return = premium collected / current stock price
+        r = bid[i] / stock_price * 36500.0 / days if days != 0 else 0.0
+        ar[i] = r if np.isfinite(r) else 0.0
+        dist[i] = (strike[i] + bid[i] - stock_price) / stock_price * 100
+    return ar, dist
+
+def calc_puts_return(option_data: pd.DataFrame, bid: np.ndarray, strike: np.ndarray, stock_price: float, days_to_expiration: int) -> pd.DataFrame:
+    """
+    Calculate the annualized return for each cash secured put.
     
-    :param option_data: DataFrame containing option data (calls or puts).
+    :param option_data: DataFrame containing put option data.
+    :param bid: Contiguous float64 array of the frame's bid column.
+    :param strike: Contiguous float64 array of the frame's strike column.
     :param stock_price: Current stock price.
     :param days_to_expiration: Days remaining to expiration.
-    :return: DataFrame with an additional column for annualized return.
+    :return: DataFrame with additional columns for annualized return and distance.
     """
-    
     # Annualized Return = (Premium Collected divided by Capital at Risk) x (365 divided by Holding Period)
     # you can use 'lastPrice', 'bid', or 'ask' as your targeted premium
-    if type == 'puts':
-        # For cash secured puts, capital reserved = (strike price - premium) * 100 * Quantity
-        # Return = premium collected / capital reserved
-        option_data['Annualized Return'] = option_data['bid'] / (option_data['strike'] - option_data['bid']) * 365 / days_to_expiration * 100
-        option_data['Distance Perc'] = (stock_price - option_data['bid'] - option_data['strike']) / stock_price
-    elif type == 'calls':
-        # For covered calls, return = premium collected / current stock price
-        option_data["Annualized Return"] = option_data['bid'] / stock_price * 365 / days_to_expiration * 100
-        option_data['Distance Perc'] = (option_data['strike'] + option_data['bid'] - stock_price) / stock_price * 100
-    # Replace infinite or NaN values (e.g., for options with zero intrinsic value)
-    option_data['Annualized Return'].replace([float('inf'), -float('inf')], 0, inplace=True)
-    option_data['Annualized Return'].fillna(0, inplace=True)
+    ar, distance = _kernel_puts(bid, strike, days_to_expiration, stock_price)
+    # The derived columns only end up in text/CSV output, so single precision is plenty
+    option_data['Annualized Return'] = ar.astype(np.float32, copy=False)
+    option_data['Distance Perc'] = distance.astype(np.float32, copy=False)
 
+    return option_data
+
+def calc_calls_return(option_data: pd.DataFrame, bid: np.ndarray, strike: np.ndarray, stock_price: float, days_to_expiration: int) -> pd.DataFrame:
+    """
+    Calculate the annualized return for each covered call.
+    
+    :param option_data: DataFrame containing call option data.
+    :param bid: Contiguous float64 array of the frame's bid column.
+    :param strike: Contiguous float64 array of the frame's strike column.
+    :param stock_price: Current stock price.
+    :param days_to_expiration: Days remaining to expiration.
+    :return: DataFrame with additional columns for annualized return and distance.
+    """
+    ar, distance = _kernel_calls(bid, strike, days_to_expiration, stock_price)
+    option_data['Annualized Return'] = ar.astype(np.float32, copy=False)
+    option_data['Distance Perc'] = distance.astype(np.float32, copy=False)
 
     return option_data
 
-def fetch_and_calculate_option_returns(ticker_symbol: str, return_filter: bool = False, in_the_money: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+KERNELS = {'puts': calc_puts_return, 'calls': calc_calls_return}
+
+def fetch_option_chains(ticker_symbol: str, executor: ThreadPoolExecutor, stock_price: Optional[float] = None) -> Tuple[Optional[float], Tuple[str, ...], Iterator[Tuple[pd.DataFrame, pd.DataFrame]]]:
     """
-    Fetch option chain data and calculate annualized returns for each put/call option.
+    Fetch the stock price, expiration dates and the option chain for every expiration.
 
     :param ticker_symbol: Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+    :param executor: Thread pool the option chain requests are submitted to.
+    :param stock_price: Current stock price, looked up from the ticker info if not given
+    :return: Stock price, expiration dates, and an iterator of (calls, puts) frames yielded in expiration order as they arrive
+    """
+    # Fetch the stock data
+    stock = get_ticker(ticker_symbol)
+    expiration_dates = with_backoff(lambda: stock.options)
+
+    if not expiration_dates:
+        print(f"No options data available for {ticker_symbol}.")
+        return stock_price, (), iter(())
+
+    if stock_price is None:
+        stock_price = with_backoff(lambda: stock.info)['currentPrice']
+
+    # Each option_chain call is a blocking HTTP round-trip, so fetch the expirations concurrently
+    def fetch_option_chain(date: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        print(f"{ticker_symbol}: Fetching data for expiration date: {date}")
+        option_chain = get_option_chain(ticker_symbol, date)
+        return option_chain.calls, option_chain.puts
+
+    return stock_price, expiration_dates, executor.map(fetch_option_chain, expiration_dates)
+
+def calculate_option_returns(expiration_dates: Sequence[str], option_chains: Iterable[Tuple[pd.DataFrame, pd.DataFrame]], stock_price: float, return_filter: bool = False, in_the_money: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Calculate annualized returns for already fetched option chains and combine them per option type.
+
+    :param expiration_dates: Expiration dates, in the same order as option_chains.
+    :param option_chains: (calls, puts) frames for each expiration date.
+    :param stock_price: Current stock price.
     :param return_filter: whether to implement a return filter
     :param in_the_money: whether to filter based on in the money
     :return: Two DataFrames, one with puts, one with calls
@@ -45,42 +304,48 @@ def fetch_and_calculate_option_returns(ticker_symbol: str, return_filter: bool =
     calls_threshold: float = 7.0
     puts_threshold: float = 15.0
 
-    # Fetch the stock data
-    stock = yf.Ticker(ticker_symbol)
-    stock_price = stock.info['currentPrice']
-    expiration_dates = stock.options
-
-    if not expiration_dates:
-        print(f"No options data available for {ticker_symbol}.")
-        return
-
     all_calls: List[pd.DataFrame] = []
     all_puts: List[pd.DataFrame] = []
 
-    # Fetch data for the first expiration date as an example
-    for date in expiration_dates:
-        print(f"{ticker_symbol}: Fetching data for expiration date: {date}")
-        option_chain = stock.option_chain(date)
-        days_to_expiration: int = (pd.to_datetime(date) - pd.Timestamp.now()).days
+    # Parse every expiration date in one vectorized pass against a single reference day
+    today = pd.Timestamp.now().normalize()
+    days_arr = (pd.to_datetime(list(expiration_dates)) - today).days.to_numpy()
+
+    # Bind the return calculations once rather than dispatching on option type per expiration
+    f_calls = KERNELS['calls']
+    f_puts = KERNELS['puts']
+
+    # Consume each chain as soon as it arrives so its raw frames can be released once the
+    # filtered rows are kept, instead of holding every unfiltered chain until the end
+    for i, (date, (calls, puts)) in enumerate(zip(expiration_dates, option_chains)):
+        days_to_expiration: int = int(days_arr[i])
 
-        # Process call and put options
-        calls: pd.DataFrame = calculate_annualized_return(option_chain.calls, stock_price, days_to_expiration, "calls")
-        calls.name = "Calls"
+        # Process call and put options, pulling each column out of the frame once as a contiguous array
+        bid = np.ascontiguousarray(calls['bid'].to_numpy(), dtype=np.float64)
+        strike = np.ascontiguousarray(calls['strike'].to_numpy(), dtype=np.float64)
+        itm = calls['inTheMoney'].to_numpy(dtype=bool)
+        calls = f_calls(calls, bid, strike, stock_price, days_to_expiration)
+        # Combine the filters into one mask so the frame is sliced (and copied) only once
+        mask = np.ones(len(calls), dtype=bool)
         if return_filter:
-            calls = calls[calls["Annualized Return"] > calls_threshold]
-            
+            mask &= calls["Annualized Return"].to_numpy() > calls_threshold
         if not in_the_money:
-            calls = calls[calls["inTheMoney"] == False]
+            mask &= ~itm
+        calls = calls.iloc[mask]
         calls["Expiration Date"] = date
         calls["Stock Price"] = stock_price
         all_calls.append(calls)
 
-        puts: pd.DataFrame = calculate_annualized_return(option_chain.puts, stock_price, days_to_expiration, "puts")
-        puts.name = "Puts"
+        bid = np.ascontiguousarray(puts['bid'].to_numpy(), dtype=np.float64)
+        strike = np.ascontiguousarray(puts['strike'].to_numpy(), dtype=np.float64)
+        itm = puts['inTheMoney'].to_numpy(dtype=bool)
+        puts = f_puts(puts, bid, strike, stock_price, days_to_expiration)
+        mask = np.ones(len(puts), dtype=bool)
         if return_filter:
-            puts = puts[puts["Annualized Return"] > puts_threshold]
+            mask &= puts["Annualized Return"].to_numpy() > puts_threshold
         if not in_the_money:
-            puts = puts[puts["inTheMoney"] == False]
+            mask &= ~itm
+        puts = puts.iloc[mask]
         puts["Expiration Date"] = date
         puts["Stock Price"] = stock_price
         all_puts.append(puts)
@@ -91,6 +356,22 @@ def fetch_and_calculate_option_returns(ticker_symbol: str, return_filter: bool =
 
     return combined_puts, combined_calls
 
+def fetch_and_calculate_option_returns(ticker_symbol: str, stock_price: Optional[float] = None, return_filter: bool = False, in_the_money: bool = False) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Fetch option chain data and calculate annualized returns for each put/call option.
+
+    :param ticker_symbol: Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+    :param stock_price: Current stock price, looked up from the ticker info if not given
+    :param return_filter: whether to implement a return filter
+    :param in_the_money: whether to filter based on in the money
+    :return: Two DataFrames, one with puts, one with calls, or None if the ticker has no options
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        stock_price, expiration_dates, option_chains = fetch_option_chains(ticker_symbol, executor, stock_price)
+        if not expiration_dates:
+            return None
+        return calculate_option_returns(expiration_dates, option_chains, stock_price, return_filter, in_the_money)
+
 def build_pivot_table(data: pd.DataFrame) -> pd.DataFrame:
     """
     Build a pivot table to display both bid price and annualized return together.
@@ -98,42 +379,109 @@ def build_pivot_table(data: pd.DataFrame) -> pd.DataFrame:
     :param data: DataFrame containing options data with expiration dates, strikes, bid, and annualized returns.
     :return: Multi-index pivot table.
     """
-    # Pivot table creation
-    pivot = pd.pivot_table(
-        data,
-        index='strike',  # Rows: Strike Prices
-        columns='Expiration Date',  # Columns: Expiration Dates
-        values=['bid', 'Annualized Return'],  # Values: Bid and Annualized Return
-        aggfunc='mean'  # Aggregation function (e.g., mean if duplicates exist)
-    )
+    # Encode the (strike, expiration) pair as one contiguous integer key per row so each group is
+    # found in a single bincount pass instead of hashing the composite key column by column
+    strike_codes, strikes = pd.factorize(data['strike'], sort=True)
+    date_codes, dates = pd.factorize(data['Expiration Date'], sort=True)
+    valid_keys = (strike_codes >= 0) & (date_codes >= 0)
+    n_cells = len(strikes) * len(dates)
+    keys = strike_codes[valid_keys] * len(dates) + date_codes[valid_keys]
+
+    columns = {}
+    for column in ['bid', 'Annualized Return']:
+        values = data[column].to_numpy(dtype=np.float64)[valid_keys]
+        # Mean over non-NaN values only; cells without any values come out as NaN
+        present = ~np.isnan(values)
+        sums = np.bincount(keys, weights=np.where(present, values, 0.0), minlength=n_cells)
+        counts = np.bincount(keys, weights=present, minlength=n_cells)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = (sums / counts).reshape(len(strikes), len(dates))
+        # Accumulate in float64 but keep float32 columns in float32; anything else comes back as float64
+        means = means.astype(np.result_type(data[column].dtype, np.float32), copy=False)
+        columns[column] = pd.DataFrame(
+            means,
+            index=pd.Index(strikes, name='strike'),
+            columns=pd.Index(dates, name='Expiration Date'),
+        )
+    # Like pivot_table, leave out strikes and columns that have no values at all
+    pivot = pd.concat(columns, axis=1).dropna(how='all').dropna(how='all', axis=1)
 
     pivot = pivot.swaplevel(axis=1).sort_index(axis=1)
     # pivot = pivot.applymap(lambda x: f"{x:.2f}%" if isinstance(x, float) and 'Annualized Return' in str(x) else f"{x:.2f}")
 
     return pivot
 
+def write_option_returns(ticker: str, puts: pd.DataFrame, calls: pd.DataFrame) -> None:
+    """
+    Write the option tables and their pivots for one ticker.
+
+    :param ticker: Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+    :param puts: Puts with annualized returns.
+    :param calls: Calls with annualized returns.
+    """
+    output_file = f"{ticker}_option_returns.txt"
+    with open(output_file, "w") as file:
+        file.write(f"\n--- Ticker: {ticker} ---\n")
+        
+        file.write("Calls with Annualized Returns:\n")
+        # to_csv streams rows through the C writer and ends each table with a newline
+        calls.to_csv(file, sep='\t', index=False, float_format='%.4f')
+        file.write("\n")
+
+        file.write("Puts with Annualized Returns:\n")
+        puts.to_csv(file, sep='\t', index=False, float_format='%.4f')
+
+    puts_pivot = build_pivot_table(puts)
+    calls_pivot = build_pivot_table(calls)
+
+    puts_pivot.to_csv(f"{ticker}_puts_pivot.csv")
+    calls_pivot.to_csv(f"{ticker}_calls_pivot.csv")
+
+def _run_one_ticker(ticker: str, stock_price: Optional[float], write: Callable[[str, pd.DataFrame, pd.DataFrame], Any] = write_option_returns) -> None:
+    """
+    Fetch, calculate and filter the option tables for one ticker, then hand them to write.
+
+    Fetching and filtering happen in this process, chain by chain as they arrive, so only
+    the filtered tables are ever passed on.
+
+    :param ticker: Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+    :param stock_price: Current stock price, looked up from the ticker info if not given
+    :param write: Called with the ticker, puts and calls; writes the output files by default.
+    """
+    result = fetch_and_calculate_option_returns(ticker, stock_price=stock_price, return_filter=True, in_the_money=False)
+    if result is not None:
+        puts, calls = result
+        write(ticker, puts, calls)
+
 if __name__ == "__main__":
     # Example usage
     # tickers = ["EBAY", "PAG", "AN", "HCC", "AMR", "TPH", "PHM", "TOL", "DAC", "SOC", "OXY", "GOOG"]
     #tickers = ['EBAY', "PAG", "AN", "HCC", "AMR", "TPH", "PHM", "TOL", "DAC", "OXY", "GOOG"]
     tickers = ['PDD']
 
-    for ticker in tickers:
-        puts, calls = fetch_and_calculate_option_returns(ticker, return_filter=True, in_the_money=False)
-        output_file = f"{ticker}_option_returns.txt"
-        with open(output_file, "w") as file:
-            file.write(f"\n--- Ticker: {ticker} ---\n")
-            
-            file.write("Calls with Annualized Returns:\n")
-            file.write(calls.to_string(index=False))
-            file.write("\n\n")
-
-            file.write("Puts with Annualized Returns:\n")
-            file.write(puts.to_string(index=False))
-            file.write("\n")
-
-        puts_pivot = build_pivot_table(puts)
-        calls_pivot = build_pivot_table(calls)
-
-        puts_pivot.to_csv(f"{ticker}_puts_pivot.csv")
-        calls_pivot.to_csv(f"{ticker}_calls_pivot.csv")
\ No newline at end of file
+    # One batched quote lookup instead of a full info scrape per ticker; tickers missing from
+    # the response fall back to the info lookup inside fetch_option_chains
+    prices: Dict[str, float] = {}
+    if tickers:
+        try:
+            prices = fetch_current_prices(tickers)
+        except (requests.RequestException, KeyError, ValueError) as exc:
+            # The batch lookup is only a shortcut, so a failed handshake or unexpected payload must not stop the run
+            print(f"Batch quote lookup failed ({exc!r}), falling back to per-ticker info lookups.")
+
+    if len(tickers) <= 1:
+        # A worker process would only add spawn and import overhead for a single ticker
+        for ticker in tickers:
+            _run_one_ticker(ticker, prices.get(ticker))
+    else:
+        # All Yahoo requests and the per-chain filtering stay in this process, so they share one
+        # rate limiter and one cache connection. Only the filtered tables are handed to worker
+        # processes for CSV formatting and pivoting, which then overlaps with fetching the next
+        # ticker. Workers never fetch, so they never build a session or open the cache file.
+        workers = min(os.cpu_count() or 1, len(tickers))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = []
+            for ticker in tickers:
+                _run_one_ticker(ticker, prices.get(ticker), lambda *args: futures.append(executor.submit(write_option_returns, *args)))
+            for future in futures:
+                future.result()
@@ -0,0 +1,187 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+import option_chain
+from option_chain import _kernel_calls, _kernel_puts, _run_one_ticker, build_pivot_table, with_backoff, write_option_returns
+
+
+def expected_pivot(data):
+    return pd.pivot_table(
+        data,
+        index='strike',
+        columns='Expiration Date',
+        values=['bid', 'Annualized Return'],
+        aggfunc='mean',
+    ).swaplevel(axis=1).sort_index(axis=1)
+
+
+def test_build_pivot_table_matches_pivot_table():
+    rng = np.random.default_rng(0)
+    n = 200
+    data = pd.DataFrame({
+        'strike': rng.choice([90.0, 95.0, 100.0, 105.0, 110.0], size=n),
+        'Expiration Date': rng.choice(['2024-01-19', '2024-02-16', '2024-03-15'], size=n),
+        'bid': rng.uniform(0.0, 5.0, size=n),
+        'Annualized Return': rng.uniform(0.0, 40.0, size=n).astype(np.float32),
+    })
+    # Duplicate (strike, expiration) pairs, missing values and an empty cell
+    data.loc[::7, 'bid'] = np.nan
+    data = data[~((data['strike'] == 110.0) & (data['Expiration Date'] == '2024-03-15'))]
+    # A strike with nothing but missing values
+    data = pd.concat([data, pd.DataFrame({
+        'strike': [1.0],
+        'Expiration Date': ['2024-01-19'],
+        'bid': [np.nan],
+        'Annualized Return': np.array([np.nan], dtype=np.float32),
+    })], ignore_index=True)
+
+    pd.testing.assert_frame_equal(build_pivot_table(data), expected_pivot(data), check_column_type=False)
+
+
+def test_build_pivot_table_integer_column():
+    data = pd.DataFrame({
+        'strike': [90.0, 100.0, 100.0],
+        'Expiration Date': ['2024-01-19', '2024-02-16', '2024-02-16'],
+        'bid': np.array([0, 1, 2], dtype=np.int64),
+        'Annualized Return': np.array([1.0, 2.0, 3.0], dtype=np.float32),
+    })
+
+    pd.testing.assert_frame_equal(build_pivot_table(data), expected_pivot(data), check_column_type=False)
+
+
+# Zero capital (bid == strike), NaN bid, bid above strike and an ordinary option
+KERNEL_BID = np.array([2.0, np.nan, 12.0, 1.5])
+KERNEL_STRIKE = np.array([2.0, 10.0, 10.0, 100.0])
+
+
+def reference_returns(bid, strike, days, stock_price, type):
+    # The original pandas expressions the kernels replaced
+    bid, strike = pd.Series(bid), pd.Series(strike)
+    if type == 'puts':
+        ar = bid / (strike - bid) * 365 / days * 100
+        distance = (stock_price - bid - strike) / stock_price
+    else:
+        ar = bid / stock_price * 365 / days * 100
+        distance = (strike + bid - stock_price) / stock_price * 100
+    ar = ar.replace([float('inf'), -float('inf')], 0).fillna(0)
+    return ar.to_numpy(), distance.to_numpy()
+
+
+@pytest.mark.parametrize('days', [0, 30])
+@pytest.mark.parametrize('type, kernel', [('puts', _kernel_puts), ('calls', _kernel_calls)])
+def test_kernels_match_pandas_expressions(type, kernel, days):
+    ar, distance = kernel(KERNEL_BID, KERNEL_STRIKE, days, 105.0)
+    expected_ar, expected_distance = reference_returns(KERNEL_BID, KERNEL_STRIKE, days, 105.0, type)
+
+    assert np.isfinite(ar).all()
+    np.testing.assert_allclose(ar, expected_ar)
+    np.testing.assert_allclose(distance, expected_distance)
+
+
+def test_kernels_zero_non_finite_returns():
+    ar, _ = _kernel_puts(KERNEL_BID, KERNEL_STRIKE, 30, 105.0)
+    assert ar[0] == 0.0 and ar[1] == 0.0
+    ar, _ = _kernel_calls(KERNEL_BID, KERNEL_STRIKE, 0, 105.0)
+    assert (ar == 0.0).all()
+
+
+def stub_chain():
+    frame = pd.DataFrame({
+        'strike': [90.0, 100.0, 110.0],
+        'bid': [2.0, 5.0, 1.0],
+        'inTheMoney': [False, True, False],
+    })
+    return SimpleNamespace(calls=frame.copy(), puts=frame.copy())
+
+
+def test_run_one_ticker_filters_stub_chains(monkeypatch):
+    today = pd.Timestamp.now().normalize()
+    dates = tuple((today + pd.Timedelta(days=days)).strftime('%Y-%m-%d') for days in (10, 20))
+    stock = SimpleNamespace(options=dates, option_chain=lambda date: stub_chain())
+    monkeypatch.setattr(option_chain, 'get_ticker', lambda symbol: stock)
+    written = []
+
+    _run_one_ticker('XYZ', 100.0, lambda *args: written.append(args))
+
+    [(ticker, puts, calls)] = written
+    assert ticker == 'XYZ'
+    for frame, threshold in ((calls, 7.0), (puts, 15.0)):
+        assert not frame['inTheMoney'].any()
+        assert (frame['Annualized Return'] > threshold).all()
+        assert set(frame['Expiration Date']) <= set(dates)
+        assert (frame['Stock Price'] == 100.0).all()
+    assert len(calls) > 0 and len(puts) > 0
+
+
+def test_write_option_returns_in_spawned_worker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    frame = pd.DataFrame({
+        'strike': [90.0, 110.0],
+        'bid': [2.0, 1.0],
+        'Annualized Return': np.array([20.0, 30.0], dtype=np.float32),
+        'Expiration Date': ['2024-01-19', '2024-01-19'],
+    })
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        executor.submit(write_option_returns, 'XYZ', frame, frame).result()
+
+    for name in ('XYZ_option_returns.txt', 'XYZ_puts_pivot.csv', 'XYZ_calls_pivot.csv'):
+        assert (tmp_path / name).exists()
+    # Output workers never fetch, so they must not open the response cache
+    assert not (tmp_path / 'yfinance.cache').exists()
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def failing(exc):
+    attempts = []
+
+    def fn():
+        attempts.append(exc)
+        raise exc
+
+    return fn, attempts
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(option_chain.time, 'sleep', lambda seconds: None)
+
+
+@pytest.mark.parametrize('exc', [http_error(429), http_error(500), http_error(503), requests.ConnectionError()])
+def test_with_backoff_retries_transient_errors(no_sleep, exc):
+    fn, attempts = failing(exc)
+    with pytest.raises(type(exc)):
+        with_backoff(fn, retries=3)
+    assert len(attempts) == 4
+
+
+@pytest.mark.parametrize('exc', [http_error(401), http_error(404), requests.HTTPError(response=None), KeyError('currentPrice')])
+def test_with_backoff_raises_permanent_errors_immediately(no_sleep, exc):
+    fn, attempts = failing(exc)
+    with pytest.raises(type(exc)):
+        with_backoff(fn, retries=3)
+    assert len(attempts) == 1
+
+
+def test_with_backoff_returns_after_transient_failure(no_sleep):
+    attempts = []
+
+    def fn(value):
+        attempts.append(value)
+        if len(attempts) < 3:
+            raise http_error(429)
+        return value
+
+    assert with_backoff(fn, 'ok', retries=5) == 'ok'
+    assert len(attempts) == 3